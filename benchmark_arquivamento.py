@@ -0,0 +1,67 @@
+"""
+benchmark_arquivamento.py
+Mede a latência das consultas das tabelas "quentes" (eventos_com_vagas e total_inscritos_por_evento)
+à medida que anos de histórico se acumulam, comparando um banco sem arquivamento com outro
+que roda SistemaEventos.arquivar_eventos_passados ao fim de cada ano simulado.
+
+Uso:
+    python benchmark_arquivamento.py [ANOS] [EVENTOS_POR_ANO] [INSCRITOS_POR_EVENTO]
+"""
+
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+from cadastro_eventos import SistemaEventos, Workshop
+
+REPETICOES = 15
+EVENTOS_FUTUROS = 20
+
+def inserir_ano_passado(db_path, ano, eventos, inscritos):
+    # Evento() rejeita datas passadas, então o histórico é gravado direto no banco
+    with sqlite3.connect(db_path) as conn:
+        cur = conn.cursor()
+        for i in range(eventos):
+            data = f"{(i % 28) + 1:02d}/{(i % 12) + 1:02d}/{ano}"
+            cur.execute("INSERT INTO eventos (nome, data, local, capacidade, categoria, preco, extra, tipo) "
+                        "VALUES (?, ?, 'L', ?, 'Workshop', 10, 'Mat', 'Workshop')", (f"E{ano}-{i}", data, inscritos))
+            eid = cur.lastrowid
+            cur.executemany("INSERT INTO participantes (nome, email, checkin, evento_id) VALUES (?, ?, 1, ?)",
+                            [(f"P{j}", f"p{j}.{eid}@x.com", eid) for j in range(inscritos)])
+
+def criar_eventos_futuros(sistema):
+    for i in range(EVENTOS_FUTUROS):
+        eid = sistema.cadastrar_evento(Workshop(f"Futuro {i}", "31/12/2099", "L", 50, 10, "Mat"))
+        for j in range(10):
+            sistema.inscrever_participante(f"F{j}", f"f{j}.{eid}@x.com", eid)
+
+def latencia_ms(funcao):
+    tempos = []
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos) * 1000
+
+def main(anos=10, eventos_por_ano=300, inscritos_por_evento=50):
+    with tempfile.TemporaryDirectory() as pasta:
+        sem = SistemaEventos(os.path.join(pasta, "sem_arquivo.db"))
+        com = SistemaEventos(os.path.join(pasta, "com_arquivo.db"))
+        criar_eventos_futuros(sem)
+        criar_eventos_futuros(com)
+
+        print(f"{'anos':>4} | {'vagas sem arq. (ms)':>19} | {'vagas com arq. (ms)':>19} | {'inscritos sem (ms)':>18} | {'inscritos com (ms)':>18}")
+        ano_inicial = 2000
+        for ano in range(ano_inicial, ano_inicial + anos):
+            for caminho in ("sem_arquivo.db", "com_arquivo.db"):
+                inserir_ano_passado(os.path.join(pasta, caminho), ano, eventos_por_ano, inscritos_por_evento)
+            com.arquivar_eventos_passados()
+            print(f"{ano - ano_inicial + 1:>4} | {latencia_ms(sem.eventos_com_vagas):>19.2f} | {latencia_ms(com.eventos_com_vagas):>19.2f}"
+                  f" | {latencia_ms(sem.total_inscritos_por_evento):>18.2f} | {latencia_ms(com.total_inscritos_por_evento):>18.2f}")
+        print(f"\nEventos arquivados consultáveis: {len(com.resumo_eventos_arquivados())}")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -5,12 +5,24 @@ Foram adicionadas as classes Evento, Workshop, Palestra e SistemaEventos.
 Novas linhas e alterações possuem comentários explicativos.
 """
 
+import os
 import sqlite3
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 DB_PATH = "eventos.db"  # arquivo SQLite (criado automaticamente)
 
+# tipos de alteração publicados no log de alterações (tabela alteracoes)
+ALTERACAO_EVENTO = "evento"
+ALTERACAO_INSCRICAO = "inscricao"
+ALTERACAO_CANCELAMENTO = "cancelamento"
+ALTERACAO_CHECKIN = "checkin"
+ALTERACAO_ARQUIVAMENTO = "arquivamento"
+
+# coluna data (DD/MM/AAAA) convertida para AAAA-MM-DD, comparável com date('now')
+DATA_ISO_SQL = "substr(data, 7, 4) || '-' || substr(data, 4, 2) || '-' || substr(data, 1, 2)"
+
 # ----------------------- Classe Evento (superclasse) -----------------------
 class Evento:
     def __init__(self, nome: str, data: str, local: str, capacidade_maxima: int, categoria: str, preco_ingresso: float, extra: Optional[str] = None, evento_id: Optional[int] = None):
@@ -88,21 +100,61 @@ class Palestra(Evento):
         base = super().detalhes()
         return base + f"\nPalestrante: {self.get_extra()}"
 
+# ----------------------- Acompanhamento do log (estado comum sync/async) -----------------------
+class _Acompanhamento:
+    def __init__(self, cursor: int, espera_maxima: Optional[float]):
+        self.cursor = cursor
+        self.__espera_maxima = espera_maxima
+        self.__ocioso_desde = time.monotonic()
+
+    def continuar(self, novas: List[tuple]) -> bool:
+        # avança o cursor com as alterações lidas; False quando passou espera_maxima sem novidades
+        if novas:
+            self.cursor = novas[-1][0]
+            self.__ocioso_desde = time.monotonic()
+            return True
+        return self.__espera_maxima is None or time.monotonic() - self.__ocioso_desde < self.__espera_maxima
+
 # ----------------------- SistemaEventos (gerenciador + persistência) -----------------------
 class SistemaEventos:
-    def __init__(self, db_path: str = DB_PATH):
+    def __init__(self, db_path: str = DB_PATH, arquivo_path: Optional[str] = None):
         self.__db_path = db_path
+        # banco de arquivo para eventos passados (padrão: eventos.db -> eventos_arquivo.db)
+        self.__arquivo_path = arquivo_path or os.path.splitext(db_path)[0] + "_arquivo.db"
+        self.__conn = None  # conexão compartilhada (ver abrir_conexao), None = uma conexão por operação
         # cria as tabelas caso não existam (criação automática) - nova funcionalidade
         self.__criar_tabelas()
 
     def __conexao(self):
-        # cria conexão com SQLite (método privado)
+        # cria conexão com SQLite (método privado); reaproveita a compartilhada, se aberta
+        if self.__conn is not None:
+            return self.__conn
         return sqlite3.connect(self.__db_path)
 
+    def abrir_conexao(self):
+        # mantém uma única conexão aberta para várias operações seguidas (ex.: modo lote da CLI)
+        if self.__conn is None:
+            # check_same_thread=False: acompanhar_alteracoes_async lê o log em uma thread auxiliar
+            self.__conn = sqlite3.connect(self.__db_path, check_same_thread=False)
+        return self
+
+    def fechar_conexao(self):
+        if self.__conn is not None:
+            self.__conn.close()
+            self.__conn = None
+
+    def __enter__(self):
+        return self.abrir_conexao()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.fechar_conexao()
+
     def __criar_tabelas(self):
         # cria as tabelas eventos e participantes, se não existirem
         with self.__conexao() as conn:
             cur = conn.cursor()
+            # só tem efeito em bancos novos (antes da primeira tabela): permite incremental_vacuum
+            cur.execute("PRAGMA auto_vacuum = INCREMENTAL")
             cur.execute("""
                 CREATE TABLE IF NOT EXISTS eventos (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -126,8 +178,29 @@ class SistemaEventos:
                     FOREIGN KEY(evento_id) REFERENCES eventos(id)
                 )
             """)
+            # log de alterações append-only (nova funcionalidade): seq cresce monotonicamente
+            # (AUTOINCREMENT garante que nunca é reutilizado), permitindo que painéis leiam
+            # apenas o que mudou desde o último cursor em vez de refazer o GROUP BY
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS alteracoes (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tipo TEXT NOT NULL,
+                    evento_id INTEGER NOT NULL,
+                    participante_id INTEGER,
+                    checkin INTEGER,
+                    capacidade INTEGER,
+                    nome TEXT,
+                    momento TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+                )
+            """)
             conn.commit()
 
+    def __registrar_alteracao(self, cur, tipo: str, evento_id: int, participante_id: Optional[int] = None,
+                              checkin: Optional[int] = None, capacidade: Optional[int] = None, nome: Optional[str] = None):
+        # grava a alteração no mesmo cursor/transação da operação (método privado)
+        cur.execute("INSERT INTO alteracoes (tipo, evento_id, participante_id, checkin, capacidade, nome) VALUES (?, ?, ?, ?, ?, ?)",
+                    (tipo, evento_id, participante_id, checkin, capacidade, nome))
+
     # ----------------------- CRUD de Eventos -----------------------
     def cadastrar_evento(self, evento: Evento):
         # insere evento no banco (mantendo compatibilidade com a API anterior)
@@ -138,8 +211,10 @@ class SistemaEventos:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """, (evento.get_nome(), evento.get_data().strftime("%d/%m/%Y"), evento.get_local(),
                   evento.get_capacidade(), evento.get_categoria(), evento.get_preco(), evento.get_extra(), evento.__class__.__name__))
-            conn.commit()
             evento_id = cur.lastrowid
+            # painéis recebem nome e capacidade de eventos criados depois do retrato inicial
+            self.__registrar_alteracao(cur, ALTERACAO_EVENTO, evento_id, capacidade=evento.get_capacidade(), nome=evento.get_nome())
+            conn.commit()
             return evento_id  # id do registro criado
 
     def listar_eventos(self) -> List[Evento]:
@@ -212,31 +287,36 @@ class SistemaEventos:
                 raise ValueError("Esse e-mail já está inscrito neste evento.")
 
             cur.execute("INSERT INTO participantes (nome, email, checkin, evento_id) VALUES (?, ?, 0, ?)", (nome, email, evento_id))
+            participante_id = cur.lastrowid
+            self.__registrar_alteracao(cur, ALTERACAO_INSCRICAO, evento_id, participante_id, checkin=0)
             conn.commit()
-            return cur.lastrowid
+            return participante_id
 
     def cancelar_inscricao(self, email: str):
         # remove participante por email (em qualquer evento)
         with self.__conexao() as conn:
             cur = conn.cursor()
-            cur.execute("SELECT id FROM participantes WHERE LOWER(email)=?", (email.lower(),))
+            cur.execute("SELECT id, evento_id, checkin FROM participantes WHERE LOWER(email)=?", (email.lower(),))
             row = cur.fetchone()
             if not row:
                 return False
             cur.execute("DELETE FROM participantes WHERE id=?", (row[0],))
+            # checkin do participante removido: permite ao painel descontar também os check-ins
+            self.__registrar_alteracao(cur, ALTERACAO_CANCELAMENTO, row[1], row[0], checkin=row[2])
             conn.commit()
             return True
 
     def realizar_checkin(self, email: str):
         with self.__conexao() as conn:
             cur = conn.cursor()
-            cur.execute("SELECT id, checkin FROM participantes WHERE LOWER(email)=?", (email.lower(),))
+            cur.execute("SELECT id, checkin, evento_id FROM participantes WHERE LOWER(email)=?", (email.lower(),))
             row = cur.fetchone()
             if not row:
                 return False
             if row[1] == 1:
                 return "Já fez check-in"
             cur.execute("UPDATE participantes SET checkin=1 WHERE id=?", (row[0],))
+            self.__registrar_alteracao(cur, ALTERACAO_CHECKIN, row[2], row[0], checkin=1)
             conn.commit()
             return True
 
@@ -274,6 +354,200 @@ class SistemaEventos:
             preco, qtd = row
             return preco * qtd
 
+    # ----------------------- Log de alterações (painéis ao vivo) -----------------------
+    def vagas_com_cursor(self) -> Tuple[List[tuple], int]:
+        # retrato inicial para painéis: (id, nome, vagas_restantes, checkins) de todos os eventos
+        # + o cursor (último seq) lido na mesma transação, para continuar com ler_alteracoes
+        with self.__conexao() as conn:
+            cur = conn.cursor()
+            cur.execute("BEGIN")
+            cur.execute("""
+                SELECT e.id, e.nome, e.capacidade - COUNT(p.id) as vagas_restantes, COALESCE(SUM(p.checkin), 0)
+                FROM eventos e LEFT JOIN participantes p ON e.id = p.evento_id
+                GROUP BY e.id
+            """)
+            rows = cur.fetchall()
+            cur.execute("SELECT COALESCE(MAX(seq), 0) FROM alteracoes")
+            cursor = cur.fetchone()[0]
+            conn.commit()
+            return rows, cursor
+
+    def ler_alteracoes(self, cursor: int = 0, limite: Optional[int] = None) -> List[tuple]:
+        # retorna (seq, tipo, evento_id, participante_id, checkin, capacidade, nome, momento) com seq > cursor,
+        # em ordem; capacidade/nome só vêm preenchidos em "evento" e checkin em inscrição/check-in/cancelamento.
+        # "arquivamento" (com nome) indica que o evento saiu das tabelas quentes (arquivar_eventos_passados).
+        # usa a chave primária seq, então o custo é proporcional ao número de alterações novas
+        sql = ("SELECT seq, tipo, evento_id, participante_id, checkin, capacidade, nome, momento "
+               "FROM alteracoes WHERE seq > ? ORDER BY seq")
+        params = (cursor,)
+        if limite is not None:
+            sql += " LIMIT ?"
+            params = (cursor, limite)
+        with self.__conexao() as conn:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def acompanhar_alteracoes(self, cursor: int = 0, intervalo: float = 1.0, espera_maxima: Optional[float] = None) -> Iterator[tuple]:
+        # gerador que acompanha o log a partir do cursor (como um "tail -f");
+        # espera_maxima encerra o gerador após esse tempo sem novidades (None = infinito)
+        estado = _Acompanhamento(cursor, espera_maxima)
+        while True:
+            novas = self.ler_alteracoes(estado.cursor)
+            if not estado.continuar(novas):
+                return
+            yield from novas
+            if not novas:
+                time.sleep(intervalo)
+
+    async def acompanhar_alteracoes_async(self, cursor: int = 0, intervalo: float = 1.0, espera_maxima: Optional[float] = None):
+        # versão asyncio de acompanhar_alteracoes (uso: async for alteracao in ...);
+        # a consulta roda em uma thread auxiliar para não bloquear o loop de eventos
+        import asyncio  # import tardio: asyncio é caro de carregar e só este método o usa
+        estado = _Acompanhamento(cursor, espera_maxima)
+        while True:
+            novas = await asyncio.to_thread(self.ler_alteracoes, estado.cursor)
+            if not estado.continuar(novas):
+                return
+            for alteracao in novas:
+                yield alteracao
+            if not novas:
+                await asyncio.sleep(intervalo)
+
+    # ----------------------- Arquivamento de eventos passados -----------------------
+    def __criar_tabelas_arquivo(self, cur):
+        # tabelas do banco de arquivo (anexado como "arquivo"); ids originais são preservados
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS arquivo.eventos (
+                id INTEGER PRIMARY KEY,
+                nome TEXT NOT NULL,
+                data TEXT NOT NULL,
+                local TEXT NOT NULL,
+                capacidade INTEGER NOT NULL,
+                categoria TEXT NOT NULL,
+                preco REAL NOT NULL,
+                extra TEXT,
+                tipo TEXT NOT NULL
+            )
+        """)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS arquivo.participantes (
+                id INTEGER PRIMARY KEY,
+                nome TEXT NOT NULL,
+                email TEXT NOT NULL,
+                checkin INTEGER DEFAULT 0,
+                evento_id INTEGER
+            )
+        """)
+        # agregados calculados no momento do arquivamento (consultáveis sem varrer participantes)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS arquivo.resumo_eventos (
+                evento_id INTEGER PRIMARY KEY,
+                nome TEXT NOT NULL,
+                data TEXT NOT NULL,
+                categoria TEXT NOT NULL,
+                capacidade INTEGER NOT NULL,
+                inscritos INTEGER NOT NULL,
+                checkins INTEGER NOT NULL,
+                receita REAL NOT NULL,
+                arquivado_em TEXT NOT NULL DEFAULT (datetime('now', 'localtime'))
+            )
+        """)
+        # log de alterações dos eventos arquivados; seq original mantido (cursores continuam válidos)
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS arquivo.alteracoes (
+                seq INTEGER PRIMARY KEY,
+                tipo TEXT NOT NULL,
+                evento_id INTEGER NOT NULL,
+                participante_id INTEGER,
+                checkin INTEGER,
+                capacidade INTEGER,
+                nome TEXT,
+                momento TEXT NOT NULL
+            )
+        """)
+
+    def arquivar_eventos_passados(self, lote: int = 500, compactar: bool = True) -> int:
+        # move eventos com data anterior a hoje (com participantes e log de alterações) para o banco
+        # de arquivo, em transações de até `lote` eventos; retorna quantos eventos foram arquivados
+        if not isinstance(lote, int) or lote < 1:
+            raise ValueError("O tamanho do lote deve ser um número inteiro positivo.")
+        conn = self.__conexao()
+        total = 0
+        try:
+            # nada a arquivar: evita anexar (e criar) o banco de arquivo
+            cur = conn.cursor()
+            cur.execute(f"SELECT 1 FROM eventos WHERE {DATA_ISO_SQL} < date('now', 'localtime') LIMIT 1")
+            if not cur.fetchone():
+                return 0
+            conn.commit()  # ATTACH não pode ocorrer dentro de uma transação
+            conn.execute("ATTACH DATABASE ? AS arquivo", (self.__arquivo_path,))
+            try:
+                cur = conn.cursor()
+                self.__criar_tabelas_arquivo(cur)
+                conn.commit()
+                while True:
+                    cur.execute("BEGIN IMMEDIATE")
+                    cur.execute(f"SELECT id FROM main.eventos WHERE {DATA_ISO_SQL} < date('now', 'localtime') LIMIT ?", (lote,))
+                    ids = [row[0] for row in cur.fetchall()]
+                    if not ids:
+                        conn.commit()
+                        break
+                    marcadores = ",".join("?" * len(ids))
+                    cur.execute(f"""
+                        INSERT OR REPLACE INTO arquivo.resumo_eventos (evento_id, nome, data, categoria, capacidade, inscritos, checkins, receita)
+                        SELECT e.id, e.nome, e.data, e.categoria, e.capacidade, COUNT(p.id), COALESCE(SUM(p.checkin), 0), e.preco * COUNT(p.id)
+                        FROM main.eventos e LEFT JOIN main.participantes p ON e.id = p.evento_id
+                        WHERE e.id IN ({marcadores}) GROUP BY e.id
+                    """, ids)
+                    cur.execute(f"INSERT OR REPLACE INTO arquivo.eventos SELECT id, nome, data, local, capacidade, categoria, preco, extra, tipo FROM main.eventos WHERE id IN ({marcadores})", ids)
+                    cur.execute(f"INSERT OR REPLACE INTO arquivo.participantes SELECT id, nome, email, checkin, evento_id FROM main.participantes WHERE evento_id IN ({marcadores})", ids)
+                    cur.execute(f"INSERT OR REPLACE INTO arquivo.alteracoes SELECT seq, tipo, evento_id, participante_id, checkin, capacidade, nome, momento FROM main.alteracoes WHERE evento_id IN ({marcadores})", ids)
+                    cur.execute(f"DELETE FROM main.alteracoes WHERE evento_id IN ({marcadores})", ids)
+                    # avisa os painéis que acompanham o log de que esses eventos saíram das tabelas quentes
+                    cur.execute(f"INSERT INTO main.alteracoes (tipo, evento_id, nome) SELECT ?, id, nome FROM main.eventos WHERE id IN ({marcadores})",
+                                (ALTERACAO_ARQUIVAMENTO, *ids))
+                    cur.execute(f"DELETE FROM main.participantes WHERE evento_id IN ({marcadores})", ids)
+                    cur.execute(f"DELETE FROM main.eventos WHERE id IN ({marcadores})", ids)
+                    conn.commit()
+                    total += len(ids)
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.execute("DETACH DATABASE arquivo")
+            if total and compactar:
+                self.__compactar(conn)
+        finally:
+            if conn is not self.__conn:
+                conn.close()
+        return total
+
+    def __compactar(self, conn):
+        # devolve ao sistema de arquivos as páginas liberadas pelo arquivamento
+        modo = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if modo == 2:  # INCREMENTAL
+            conn.execute("PRAGMA incremental_vacuum").fetchall()
+        else:
+            # bancos antigos: converte para INCREMENTAL (efetivado pelo VACUUM) para as próximas vezes
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+
+    def resumo_eventos_arquivados(self) -> List[tuple]:
+        # agregados dos eventos arquivados: (evento_id, nome, data, inscritos, checkins, receita)
+        if not os.path.exists(self.__arquivo_path):
+            return []
+        conn = sqlite3.connect(self.__arquivo_path)
+        try:
+            cur = conn.cursor()
+            cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='resumo_eventos'")
+            if not cur.fetchone():
+                return []
+            cur.execute("SELECT evento_id, nome, data, inscritos, checkins, receita FROM resumo_eventos ORDER BY evento_id")
+            return cur.fetchall()
+        finally:
+            conn.close()
+
     def get_evento_por_id(self, evento_id: int) -> Optional[Evento]:
         with self.__conexao() as conn:
             cur = conn.cursor()
@@ -4,12 +4,12 @@ Funções auxiliares (validadores, limpar tela, pausar e relatórios).
 As alterações foram feitas para chamar o SistemaEventos para relatórios (SQLite).
 """
 
-import os
 from datetime import datetime
 from cadastro_eventos import SistemaEventos
 
 def limpar_tela():
-    os.system("cls" if os.name == "nt" else "clear")
+    # sequência ANSI (cursor no topo + limpa a tela) em vez de criar um processo "clear"/"cls"
+    print("\033[H\033[2J", end="", flush=True)
 
 def pausar(msg="\nPressione ENTER para voltar..."):
     input(msg)
@@ -55,6 +55,35 @@ def validar_data(campo):
         except ValueError:
             input(f"ERRO! : O campo '{campo}' deve estar no formato DD/MM/AAAA. Pressione ENTER para tentar novamente.")
 
+def imprimir_inscritos_por_evento(sistema: SistemaEventos):
+    # usado pelo menu de relatórios e pela CLI (main.py relatorio)
+    print("\n#### INSCRITOS POR EVENTO ####")
+    linha = sistema.total_inscritos_por_evento()
+    if not linha:
+        print("Nenhum evento cadastrado.")
+    else:
+        for nome, total in linha:
+            print(f"{nome}: {total} inscritos")
+
+def imprimir_eventos_com_vagas(sistema: SistemaEventos):
+    print("\n#### EVENTOS COM VAGAS DISPONÍVEIS ####")
+    rows = sistema.eventos_com_vagas()
+    if not rows:
+        print("Nenhum evento com vagas.")
+    else:
+        for eid, nome, vagas in rows:
+            print(f"{nome} -> {vagas} vagas restantes")
+
+def imprimir_receita_por_evento(sistema: SistemaEventos):
+    print("\n##### RECEITA TOTAL POR EVENTO #####")
+    termos = sistema.total_inscritos_por_evento()
+    if not termos:
+        print("Nenhum evento cadastrado.")
+    else:
+        for nome, _ in termos:
+            receita = sistema.receita_evento(nome)
+            print(f"{nome}: R${receita:.2f}")
+
 def relatorios(sistema: SistemaEventos):
     # recebe o gerenciador SistemaEventos para ler diretamente do DB (nova integração)
     while True:
@@ -67,34 +96,15 @@ def relatorios(sistema: SistemaEventos):
         opcao = input("Escolha uma opção: ")
 
         if opcao == "1":
-            print("\n#### INSCRITOS POR EVENTO ####")
-            linha = sistema.total_inscritos_por_evento()
-            if not linha:
-                print("Nenhum evento cadastrado.")
-            else:
-                for nome, total in linha:
-                    print(f"{nome}: {total} inscritos")
+            imprimir_inscritos_por_evento(sistema)
             pausar()
 
         elif opcao == "2":
-            print("\n#### EVENTOS COM VAGAS DISPONÍVEIS ####")
-            rows = sistema.eventos_com_vagas()
-            if not rows:
-                print("Nenhum evento com vagas.")
-            else:
-                for eid, nome, vagas in rows:
-                    print(f"{nome} -> {vagas} vagas restantes")
+            imprimir_eventos_com_vagas(sistema)
             pausar()
 
         elif opcao == "3":
-            print("\n##### RECEITA TOTAL POR EVENTO #####")
-            termos = sistema.total_inscritos_por_evento()
-            if not termos:
-                print("Nenhum evento cadastrado.")
-            else:
-                for nome, _ in termos:
-                    receita = sistema.receita_evento(nome)
-                    print(f"{nome}: R${receita:.2f}")
+            imprimir_receita_por_evento(sistema)
             pausar()
 
         elif opcao == "0":
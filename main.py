@@ -2,13 +2,25 @@
 main.py
 Menu principal adaptado para usar SistemaEventos (SQLite) mantendo as mensagens originais.
 Novas linhas comentadas para indicar integração com POO e DB.
+
+Sem argumentos abre o menu interativo; com argumentos funciona como CLI não interativa:
+    python main.py listar
+    python main.py inscrever EVENTO_ID NOME EMAIL
+    python main.py checkin EMAIL
+    python main.py relatorio [inscritos|vagas|receita|todos]
+    python main.py lote ARQUIVO   (um comando por linha, "-" lê da entrada padrão)
+    python main.py arquivar       (move eventos passados para o banco de arquivo)
+Os imports dos módulos do sistema são feitos dentro das funções para acelerar a inicialização.
 """
 
-from cadastro_eventos import SistemaEventos, Workshop, Palestra  # agora importamos as classes POO
-from inscricoes_participantes import InscricoesParticipantes  # usa o novo fluxo que grava no DB
-from funcoes import *
+import sys
 
 def menu():
+    # imports tardios: só carregados quando o menu interativo é realmente usado
+    from cadastro_eventos import SistemaEventos, Workshop, Palestra  # agora importamos as classes POO
+    from inscricoes_participantes import InscricoesParticipantes  # usa o novo fluxo que grava no DB
+    from funcoes import limpar_tela, pausar, validar_texto, validar_inteiro, validar_float, validar_data, relatorios
+
     sistema = SistemaEventos()  # novo: gerenciador que cria/abre o DB automaticamente
 
     while True:
@@ -169,6 +181,159 @@ def menu():
             input("Opção INVÁLIDA, pressione ENTER para tentar novamente.")
             limpar_tela()
 
+# ----------------------- CLI não interativa -----------------------
+def _cmd_listar(sistema, args):
+    eventos = sistema.listar_eventos()
+    if not eventos:
+        print("Nenhum evento cadastrado.")
+    for evento in eventos:
+        print(f"[ID {evento.get_id()}]")
+        print(evento.detalhes())
+        print()
+    return 0
+
+def _cmd_inscrever(sistema, args):
+    # mesma regra do menu (validar_texto): nome e e-mail não podem ficar em branco
+    for campo, valor in (("nome", args.nome), ("email", args.email)):
+        if not valor.strip():
+            print(f"Erro: O campo '{campo}' não pode ficar em branco.", file=sys.stderr)
+            return 1
+    try:
+        participante_id = sistema.inscrever_participante(args.nome, args.email, args.evento_id)
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 1
+    print(f"Inscrição de {args.nome} realizada com SUCESSO! (ID: {participante_id})")
+    return 0
+
+def _cmd_checkin(sistema, args):
+    res = sistema.realizar_checkin(args.email)
+    if res is True:
+        print("Check-in realizado!")
+        return 0
+    if res == "Já fez check-in":
+        print("Participante já fez check-in anteriormente.")
+        return 0
+    print("Participante NÃO encontrado.", file=sys.stderr)
+    return 1
+
+def _cmd_relatorio(sistema, args):
+    # mesmos relatórios do menu (funcoes.relatorios), sem pausas nem limpeza de tela
+    from funcoes import imprimir_inscritos_por_evento, imprimir_eventos_com_vagas, imprimir_receita_por_evento
+    if args.tipo in ("inscritos", "todos"):
+        imprimir_inscritos_por_evento(sistema)
+    if args.tipo in ("vagas", "todos"):
+        imprimir_eventos_com_vagas(sistema)
+    if args.tipo in ("receita", "todos"):
+        imprimir_receita_por_evento(sistema)
+    return 0
+
+def _cmd_arquivar(sistema, args):
+    total = sistema.arquivar_eventos_passados(lote=args.lote, compactar=not args.sem_vacuum)
+    print(f"{total} evento(s) arquivado(s).")
+    return 0
+
+def _cmd_lote(sistema, args):
+    # executa um comando por linha (linhas vazias e iniciadas por # são ignoradas),
+    # todos sobre a mesma conexão já aberta; retorna 1 se algum comando falhar
+    import shlex
+    import sqlite3
+    parser = _criar_parser(em_lote=True)  # sem --db: o lote inteiro usa o banco já aberto
+    try:
+        arquivo = sys.stdin if args.arquivo == "-" else open(args.arquivo, encoding="utf-8")
+    except OSError as e:
+        print(f"Erro: não foi possível abrir o arquivo de lote: {e}", file=sys.stderr)
+        return 1
+    codigo = 0
+    try:
+        for numero, linha in enumerate(arquivo, start=1):
+            try:
+                partes = shlex.split(linha, comments=True)
+            except ValueError as e:  # ex.: aspas sem fechamento (D'Avila)
+                print(f"Linha {numero}: Erro: {e}: {linha.strip()}", file=sys.stderr)
+                codigo = 1
+                continue
+            if not partes:
+                continue
+            if partes[0] == "lote":
+                print(f"Linha {numero}: 'lote' não pode ser usado dentro de um lote.", file=sys.stderr)
+                codigo = 1
+                continue
+            try:
+                sub_args = parser.parse_args(partes)
+            except SystemExit:
+                print(f"Linha {numero}: comando inválido: {linha.strip()}", file=sys.stderr)
+                codigo = 1
+                continue
+            try:
+                if sub_args.funcao(sistema, sub_args) != 0:
+                    codigo = 1
+            except (ValueError, sqlite3.Error) as e:
+                print(f"Linha {numero}: Erro: {e}", file=sys.stderr)
+                codigo = 1
+    finally:
+        if arquivo is not sys.stdin:
+            arquivo.close()
+    return codigo
+
+def _inteiro_positivo(valor):
+    import argparse
+    try:
+        numero = int(valor)
+    except ValueError:
+        numero = 0
+    if numero < 1:
+        raise argparse.ArgumentTypeError(f"deve ser um número inteiro positivo: {valor!r}")
+    return numero
+
+def _criar_parser(em_lote=False):
+    # em_lote=True: parser das linhas de um lote, só com os subcomandos (sem --db nem "lote")
+    import argparse
+    parser = argparse.ArgumentParser(prog="lote" if em_lote else "main.py", description="Sistema de Eventos (SQLite)")
+    if not em_lote:
+        parser.add_argument("--db", default=None, help="caminho do banco SQLite (padrão: eventos.db)")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("listar", help="lista os eventos cadastrados")
+    p.set_defaults(funcao=_cmd_listar)
+
+    p = sub.add_parser("inscrever", help="inscreve um participante em um evento")
+    p.add_argument("evento_id", type=int)
+    p.add_argument("nome")
+    p.add_argument("email")
+    p.set_defaults(funcao=_cmd_inscrever)
+
+    p = sub.add_parser("checkin", help="realiza o check-in de um participante")
+    p.add_argument("email")
+    p.set_defaults(funcao=_cmd_checkin)
+
+    p = sub.add_parser("relatorio", help="exibe relatórios")
+    p.add_argument("tipo", nargs="?", default="todos", choices=("inscritos", "vagas", "receita", "todos"))
+    p.set_defaults(funcao=_cmd_relatorio)
+
+    p = sub.add_parser("arquivar", help="move eventos passados e seus participantes para o banco de arquivo")
+    p.add_argument("--lote", type=_inteiro_positivo, default=500, help="eventos por transação (padrão: 500)")
+    p.add_argument("--sem-vacuum", action="store_true", help="não compacta o banco depois de arquivar")
+    p.set_defaults(funcao=_cmd_arquivar)
+
+    if not em_lote:
+        p = sub.add_parser("lote", help="executa comandos de um arquivo (um por linha)")
+        p.add_argument("arquivo", help='arquivo de comandos ("-" para entrada padrão)')
+        p.set_defaults(funcao=_cmd_lote)
+    return parser
+
+def executar(argv=None):
+    # ponto de entrada da CLI; retorna o código de saída
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        from funcoes import limpar_tela
+        limpar_tela()
+        menu()
+        return 0
+    args = _criar_parser().parse_args(argv)
+    from cadastro_eventos import SistemaEventos, DB_PATH
+    with SistemaEventos(args.db or DB_PATH) as sistema:  # uma única conexão para todo o comando/lote
+        return args.funcao(sistema, args)
+
 if __name__ == "__main__":
-    limpar_tela()
-    menu()
+    sys.exit(executar())
@@ -1,25 +1,32 @@
 import os
+import asyncio
+import io
+import tempfile
 import unittest
 import sqlite3
+from contextlib import redirect_stdout, redirect_stderr
 from cadastro_eventos import SistemaEventos, Workshop, Palestra
 from inscricoes_participantes import InscricoesParticipantes
+import main
 
 TEST_DB = "test_eventos.db"
+TEST_ARQUIVO_DB = "test_eventos_arquivo.db"
 
 class TestSistemaEventosSQLite(unittest.TestCase):
+    def _remover_bancos(self):
+        for caminho in (TEST_DB, TEST_ARQUIVO_DB):
+            try:
+                os.remove(caminho)
+            except FileNotFoundError:
+                pass
+
     def setUp(self):
-        # remove DB de teste se existir para garantir ambiente limpo
-        try:
-            os.remove(TEST_DB)
-        except FileNotFoundError:
-            pass
+        # remove DBs de teste se existirem para garantir ambiente limpo
+        self._remover_bancos()
         self.sistema = SistemaEventos(TEST_DB)
 
     def tearDown(self):
-        try:
-            os.remove(TEST_DB)
-        except FileNotFoundError:
-            pass
+        self._remover_bancos()
 
     def test_criar_evento_workshop(self):
         w = Workshop("WS Teste", "31/12/2099", "LocalX", 2, 100, "Notebook")
@@ -83,5 +90,176 @@ class TestSistemaEventosSQLite(unittest.TestCase):
         result = self.sistema.buscar_eventos_por_categoria("Palestra")
         self.assertTrue(len(result) >= 1)
 
+    def test_log_alteracoes_incremental(self):
+        w = Workshop("WS Log", "31/12/2099", "L", 3, 40, "Mat")
+        eid = self.sistema.cadastrar_evento(w)
+        self.sistema.inscrever_participante("A", "a@x.com", eid)
+        self.sistema.realizar_checkin("a@x.com")
+        rows, cursor = self.sistema.vagas_com_cursor()
+        self.assertEqual(rows, [(eid, "WS Log", 2, 1)])
+        # só as alterações posteriores ao cursor são lidas
+        self.sistema.inscrever_participante("B", "b@x.com", eid)
+        self.sistema.cancelar_inscricao("b@x.com")
+        self.sistema.cancelar_inscricao("a@x.com")
+        novas = self.sistema.ler_alteracoes(cursor)
+        # (tipo, evento_id, checkin): o cancelamento informa se o participante já tinha feito check-in
+        self.assertEqual([(a[1], a[2], a[4]) for a in novas],
+                         [("inscricao", eid, 0), ("cancelamento", eid, 0), ("cancelamento", eid, 1)])
+        self.assertEqual([a[0] for a in novas], sorted(a[0] for a in novas))
+        self.assertEqual(self.sistema.ler_alteracoes(novas[-1][0]), [])
+
+    def test_log_alteracoes_evento_novo(self):
+        _, cursor = self.sistema.vagas_com_cursor()
+        eid = self.sistema.cadastrar_evento(Palestra("Nova", "31/12/2099", "L", 7, 10, "Dr. Y"))
+        self.sistema.inscrever_participante("A", "a@x.com", eid)
+        novas = self.sistema.ler_alteracoes(cursor)
+        self.assertEqual([a[1:7] for a in novas],
+                         [("evento", eid, None, None, 7, "Nova"), ("inscricao", eid, novas[1][3], 0, None, None)])
+
+    def test_acompanhar_alteracoes_gerador(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS Tail", "31/12/2099", "L", 3, 40, "Mat"))
+        _, cursor = self.sistema.vagas_com_cursor()
+        self.sistema.inscrever_participante("A", "a@x.com", eid)
+        gerador = self.sistema.acompanhar_alteracoes(cursor, intervalo=0.01, espera_maxima=2)
+        self.assertEqual(next(gerador)[1], "inscricao")
+        # alteração gravada depois que o gerador já começou a acompanhar o log
+        self.sistema.realizar_checkin("a@x.com")
+        self.assertEqual(next(gerador)[1], "checkin")
+        gerador.close()
+        # sem novidades, espera_maxima encerra o gerador
+        self.assertEqual(list(self.sistema.acompanhar_alteracoes(10 ** 9, intervalo=0.01, espera_maxima=0.05)), [])
+
+    def test_acompanhar_alteracoes_async(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS Async", "31/12/2099", "L", 3, 40, "Mat"))
+        _, cursor = self.sistema.vagas_com_cursor()
+
+        async def cenario():
+            fluxo = self.sistema.acompanhar_alteracoes_async(cursor, intervalo=0.01, espera_maxima=2)
+            proxima = asyncio.ensure_future(fluxo.__anext__())
+            await asyncio.sleep(0.05)  # o fluxo lê o log vazio e fica esperando
+            self.assertFalse(proxima.done())
+            self.sistema.inscrever_participante("A", "a@x.com", eid)
+            alteracao = await asyncio.wait_for(proxima, 2)
+            await fluxo.aclose()
+            return alteracao
+        alteracao = asyncio.run(cenario())
+        self.assertEqual((alteracao[1], alteracao[2]), ("inscricao", eid))
+
+    def _executar_cli(self, *argv):
+        saida = io.StringIO()
+        with redirect_stdout(saida), redirect_stderr(io.StringIO()):
+            codigo = main.executar(["--db", TEST_DB, *argv])
+        return codigo, saida.getvalue()
+
+    def test_cli_inscrever_checkin_relatorio(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS CLI", "31/12/2099", "L", 2, 30, "Mat"))
+        self.assertEqual(self._executar_cli("inscrever", str(eid), "Ana", "ana@x.com")[0], 0)
+        self.assertEqual(self._executar_cli("checkin", "ana@x.com")[0], 0)
+        self.assertEqual(self._executar_cli("checkin", "ninguem@x.com")[0], 1)
+        codigo, saida = self._executar_cli("relatorio", "vagas")
+        self.assertEqual(codigo, 0)
+        self.assertIn("WS CLI -> 1 vagas restantes", saida)
+
+    def test_cli_lote(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS Lote", "31/12/2099", "L", 5, 30, "Mat"))
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            f.write(f'# comentário\ninscrever {eid} "Ana Maria" ana@x.com\ninscrever {eid} Bia bia@x.com\ncheckin bia@x.com\n')
+        try:
+            codigo, _ = self._executar_cli("lote", f.name)
+        finally:
+            os.remove(f.name)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(self.sistema.total_inscritos_por_evento(), [("WS Lote", 2)])
+
+    def test_cli_lote_erros(self):
+        self.assertEqual(self._executar_cli("lote", "nao_existe.txt")[0], 1)
+        eid = self.sistema.cadastrar_evento(Workshop("WS Lote Erro", "31/12/2099", "L", 5, 30, "Mat"))
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            # --db dentro do lote é rejeitado; a linha seguinte ainda é executada
+            f.write(f"--db outro.db listar\ninscrever {eid} Ana ana@x.com\n")
+        try:
+            codigo, _ = self._executar_cli("lote", f.name)
+        finally:
+            os.remove(f.name)
+        self.assertEqual(codigo, 1)
+        self.assertFalse(os.path.exists("outro.db"))
+        self.assertEqual(self.sistema.total_inscritos_por_evento(), [("WS Lote Erro", 1)])
+
+    def test_cli_lote_aspas_sem_fechamento(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS Aspas", "31/12/2099", "L", 5, 30, "Mat"))
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+            f.write(f"inscrever {eid} D'Avila d@x.com\ninscrever {eid} Bia bia@x.com\n")
+        try:
+            codigo, _ = self._executar_cli("lote", f.name)
+        finally:
+            os.remove(f.name)
+        self.assertEqual(codigo, 1)
+        self.assertEqual(self.sistema.total_inscritos_por_evento(), [("WS Aspas", 1)])
+
+    def test_cli_inscrever_campos_em_branco(self):
+        eid = self.sistema.cadastrar_evento(Workshop("WS Branco", "31/12/2099", "L", 5, 30, "Mat"))
+        self.assertEqual(self._executar_cli("inscrever", str(eid), "", "a@x.com")[0], 1)
+        self.assertEqual(self._executar_cli("inscrever", str(eid), "Ana", "  ")[0], 1)
+        self.assertEqual(self.sistema.total_inscritos_por_evento(), [("WS Branco", 0)])
+
+    def test_cli_relatorio_sem_eventos(self):
+        codigo, saida = self._executar_cli("relatorio")
+        self.assertEqual(codigo, 0)
+        self.assertIn("Nenhum evento cadastrado.", saida)
+        self.assertIn("Nenhum evento com vagas.", saida)
+
+    def _inserir_evento_passado(self, nome, data, capacidade, preco, inscritos):
+        # Evento() rejeita datas passadas, então grava direto no banco
+        with sqlite3.connect(TEST_DB) as conn:
+            cur = conn.cursor()
+            cur.execute("INSERT INTO eventos (nome, data, local, capacidade, categoria, preco, extra, tipo) VALUES (?, ?, 'L', ?, 'Workshop', ?, 'Mat', 'Workshop')",
+                        (nome, data, capacidade, preco))
+            eid = cur.lastrowid
+            for i in range(inscritos):
+                cur.execute("INSERT INTO participantes (nome, email, checkin, evento_id) VALUES (?, ?, ?, ?)",
+                            (f"P{i}", f"{nome}{i}@x.com", i % 2, eid))
+            return eid
+
+    def test_arquivar_eventos_passados(self):
+        # sem eventos passados nada é feito e o banco de arquivo nem é criado
+        self.assertEqual(self.sistema.arquivar_eventos_passados(), 0)
+        self.assertFalse(os.path.exists(TEST_ARQUIVO_DB))
+        futuro = self.sistema.cadastrar_evento(Workshop("WS Futuro", "31/12/2099", "L", 5, 10, "Mat"))
+        self.sistema.inscrever_participante("F", "f@x.com", futuro)
+        antigo1 = self._inserir_evento_passado("Antigo1", "10/03/2001", 10, 20.0, 3)
+        antigo2 = self._inserir_evento_passado("Antigo2", "25/12/2010", 10, 5.0, 0)
+        # alterações do log de um evento passado (gravadas direto, como o histórico)
+        with sqlite3.connect(TEST_DB) as conn:
+            conn.execute("INSERT INTO alteracoes (tipo, evento_id, participante_id, checkin) VALUES ('inscricao', ?, 1, 0)", (antigo1,))
+        seqs_futuro = [a[0] for a in self.sistema.ler_alteracoes() if a[2] == futuro]
+        seq_antigo = [a[0] for a in self.sistema.ler_alteracoes() if a[2] == antigo1]
+
+        self.assertEqual(self.sistema.arquivar_eventos_passados(lote=1), 2)
+        self.assertEqual(self.sistema.total_inscritos_por_evento(), [("WS Futuro", 1)])
+        self.assertEqual(self.sistema.resumo_eventos_arquivados(),
+                         [(antigo1, "Antigo1", "10/03/2001", 3, 1, 60.0),
+                          (antigo2, "Antigo2", "25/12/2010", 0, 0, 0.0)])
+        with sqlite3.connect(TEST_ARQUIVO_DB) as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM participantes").fetchone()[0], 3)
+            self.assertEqual([r[0] for r in conn.execute("SELECT seq FROM alteracoes")], seq_antigo)
+        # o log quente mantém só as alterações de eventos ativos, com os seq originais,
+        # mais um aviso de arquivamento por evento arquivado
+        log = self.sistema.ler_alteracoes()
+        self.assertEqual([a[0] for a in log[:len(seqs_futuro)]], seqs_futuro)
+        self.assertEqual([(a[1], a[2], a[6]) for a in log[len(seqs_futuro):]],
+                         [("arquivamento", antigo1, "Antigo1"), ("arquivamento", antigo2, "Antigo2")])
+        self.assertTrue(all(a[0] > seq_antigo[0] for a in log[len(seqs_futuro):]))
+        # rodar de novo não encontra nada a arquivar
+        self.assertEqual(self.sistema.arquivar_eventos_passados(), 0)
+
+    def test_arquivar_lote_invalido(self):
+        self._inserir_evento_passado("Antigo", "10/03/2001", 10, 20.0, 1)
+        for lote in (0, -1):
+            with self.assertRaises(ValueError):
+                self.sistema.arquivar_eventos_passados(lote=lote)
+        self.assertFalse(os.path.exists(TEST_ARQUIVO_DB))
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main.executar(["--db", TEST_DB, "arquivar", "--lote", "0"])
+
 if __name__ == "__main__":
     unittest.main()